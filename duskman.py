@@ -2,23 +2,47 @@ import os
 import sys
 import subprocess
 import re
+import time
+import shlex
+import signal
+import bisect
 import yaml
 import asyncio
 import aiohttp
 import argparse
 
+from functools import lru_cache
+from collections import deque
+from contextlib import nullcontext
 from rich.live import Live
 from rich.text import Text
+from rich.style import Style
 from dotenv import load_dotenv
 from rich.console import Console
 from rich import print
 from datetime import datetime, timedelta
 from utilities.notifications import NotificationService
+from utilities.timing import remaining_time
 from rich.traceback import install
 
-install()
+try:
+    from yaml import CSafeLoader as _Loader  # libyaml C bindings
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+def _rich_excepthook(*exc_info):
+    # Install Rich tracebacks on the first uncaught exception; install() builds its own
+    # stderr Console, so doing it at import would create one on every run
+    install()
+    sys.excepthook(*exc_info)
+
+sys.excepthook = _rich_excepthook
 load_dotenv()
-console = Console()
+
+@lru_cache(maxsize=1)
+def get_console():
+    """Create the Rich console on first use, so background (-d) runs never probe the terminal."""
+    return Console()
 
 # ─────────────────────────────────────────────────────────────────────────────
 # CONFIGURATION AND INITIALIZING
@@ -26,12 +50,16 @@ console = Console()
 
 
 
+@lru_cache(maxsize=None)
+def _load_yaml(file_path):
+    """Parse a YAML file once; every later section lookup reuses the cached dict."""
+    with open(file_path, "r") as file:
+        return yaml.load(file, Loader=_Loader) or {}
+
 def load_config(section="GENERAL", file_path="config.yaml"):
     """Load configuration from a YAML file."""
     try:
-        with open(file_path, "r") as file:
-            config = yaml.safe_load(file)
-            return config.get(section, {})
+        return _load_yaml(file_path).get(section, {})
     except FileNotFoundError:
         log_action("Config File error", f"Configuration file {file_path} not found. Exiting.", "error")
         sys.exit(1)
@@ -51,6 +79,7 @@ min_slashed = config.get('min_slashed', 1)
 buffer_blocks = config.get('buffer_blocks', 60)
 min_stake_amount = config.get('min_stake_amount', 1000)
 min_peers = config.get('min_peers', 10)
+command_timeout = config.get('command_timeout', 300)
 auto_stake_rewards = config.get('auto_stake_rewards', False)
 auto_reclaim_full_restakes = config.get('auto_reclaim_full_restakes', False)
 pwd_var = config.get('pwd_var_name', 'MY_WALLET_VARIABLE')
@@ -60,6 +89,8 @@ dash_ip = web_dashboard.get('dash_ip', '0.0.0.0')
 include_rendered = web_dashboard.get('include_rendered', False)
 isDebug = logs_config.get('debug', False)
 display_options = config.get('display_options', True)
+idle_refresh = config.get('idle_refresh', 5)
+alt_screen = config.get('alt_screen', True)
 monitor_wallet = notification_config.get('monitor_balance', False)
 
 # Initialize parser
@@ -75,13 +106,14 @@ args = parser.parse_args() or {}
 # Store it as a boolean variable
 display_gui = not args.d
 
+# Prefix for command argv lists
 if config.get('use_sudo', False):
-    use_sudo = 'sudo'
+    use_sudo = ['sudo']
 else:
-    use_sudo = ''
+    use_sudo = []
 
 errored = False
-log_entries = []
+log_entries = deque(maxlen=16)  # Recent log lines for the dashboard. TODO: Make configurable
 stake_checking = False
 
 INFO_LOG_FILE = logs_config.get("action_log","duskman_actions.log")
@@ -108,21 +140,16 @@ else:
 notifier = NotificationService(notification_config)
 
 
-BLACK = "\033[0;30m"
+# Colors used by the realtime display and tmux status line. The Live display is
+# decoded into Rich styles, so Rich drops them when output isn't a terminal.
 RED = "\033[0;31m"
 GREEN = "\033[0;32m"
-BROWN = "\033[0;33m"
 BLUE = "\033[0;34m"
-PURPLE = "\033[0;35m"
 CYAN = "\033[0;36m"
-LIGHT_GRAY = "\033[0;37m"
-DARK_GRAY = "\033[1;30m"
 LIGHT_RED = "\033[1;31m"
 LIGHT_GREEN = "\033[1;32m"
 YELLOW = "\033[1;33m"
 LIGHT_BLUE = "\033[1;34m"
-LIGHT_PURPLE = "\033[1;35m"
-LIGHT_CYAN = "\033[1;36m"
 LIGHT_WHITE = "\033[1;37m"
 
 DEFAULT = "\033[1;39m"
@@ -135,7 +162,7 @@ DEFAULT = "\033[1;39m"
 
 shared_state = {
     "block_height": 0,
-    "remain_time": 0,                 # seconds left in the current sleep
+    "sleep_deadline": 0.0,            # time.monotonic() at which the current sleep ends
     "last_no_action_block": None,     # track 'No Action' blocks
     "last_claim_block": 0,
     "stake_info": {
@@ -166,6 +193,19 @@ shared_state = {
 # Log format
 LOG_FORMAT = "{timestamp} - {message}"
 
+# Precompiled patterns for parsing command output
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_ANSI_BYTES_RE = re.compile(rb'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_STAKE_RE = re.compile(r"(Eligible stake|Reclaimable slashed stake|Accumulated rewards is):\s*(\d+(?:\.\d+)?)\s*DUSK")
+_ACTIVE_BLK_RE = re.compile(r"Stake active from block #(\d+)")
+_PROFILE_RE = re.compile(r"(Shielded|Public) account\s*-\s*(\S+)")
+
+# The escape codes the display itself emits, stripped with plain str.replace
+_ANSI_CONSTS = (
+    RED, GREEN, BLUE, CYAN, LIGHT_RED, LIGHT_GREEN, YELLOW,
+    LIGHT_BLUE, LIGHT_WHITE, DEFAULT, UNDERLINE, END_UNDERLINE,
+)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # HELPER FUNCTIONS
 # ─────────────────────────────────────────────────────────────────────────────
@@ -184,6 +224,17 @@ def get_env_variable(var_name='WALLET_PASSWORD', dotenv_key='WALLET_PASSWORD'):
 
 password = get_env_variable(config.get('pwd_var_name', 'WALLET_PASSWORD'), dotenv_key="WALLET_PASSWORD")
 
+# Command argv tuples, built once
+CMD_BLOCK_HEIGHT = (*use_sudo, 'ruskquery', 'block-height')
+CMD_PEERS = (*use_sudo, 'ruskquery', 'peers')
+CMD_WALLET = (*use_sudo, 'rusk-wallet', '--password', password)
+CMD_STAKE_INFO = (*CMD_WALLET, 'stake-info')
+CMD_PROFILES = (*CMD_WALLET, 'profiles')
+CMD_BALANCE = (*CMD_WALLET, 'balance', '--spendable', '--address')
+CMD_WITHDRAW = (*CMD_WALLET, 'withdraw')
+CMD_UNSTAKE = (*CMD_WALLET, 'unstake')
+CMD_STAKE = (*CMD_WALLET, 'stake', '--amt')
+
 
 def display_wallet_distribution_bar(public_amount, shielded_amount, width=30):
     """
@@ -244,42 +295,146 @@ def convert_to_float(value):
         return 0.0
     
 def remove_ansi(text):
-    # Regular expression to match ANSI escape sequences
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    # Strip ANSI escape sequences; the known color codes go first, the regex
+    # only runs if some other escape sequence is left over
+    for code in _ANSI_CONSTS:
+        text = text.replace(code, '')
+    if '\x1b' in text:
+        text = _ANSI_RE.sub('', text)
+    return text
+
+def format_command(argv):
+    """Join a command argv list for logging, masking the wallet password."""
+    return ' '.join(argv).replace(password, '#####')
+
+# Seconds a timed-out command gets to exit after SIGTERM before its process group is killed
+KILL_GRACE_SECS = 5
+
+def _signal_group(process, sig):
+    try:
+        os.killpg(process.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
 
-async def execute_command_async(command=str(), log_output=True):
-    """Execute a shell command asynchronously and return its output (stdout)."""
+async def stop_process_group(process):
+    """
+    Stop a command started in its own session. SIGTERM goes to the whole group
+    first, which sudo relays to the rusk command it runs (a SIGKILL can't be
+    relayed and would orphan it), then SIGKILL if it hasn't exited in time.
+    """
+    _signal_group(process, signal.SIGTERM)
+    try:
+        async with asyncio.timeout(KILL_GRACE_SECS):
+            await process.wait()
+    except TimeoutError:
+        _signal_group(process, signal.SIGKILL)
+        await process.wait()
+
+async def execute_command_async(argv, log_output=True, timeout=command_timeout):
+    """
+    Execute a command asynchronously (without a shell) and return its output (stdout).
+    Pass timeout=None for commands that must never be interrupted, like wallet transactions.
+    """
     try:
         if log_output:
-            cmd2 = command
-            if log_output:
-                log_action("Executing Command", cmd2.replace(password,'#####'), "debug")
-        process = await asyncio.create_subprocess_shell(
-            command,
+            log_action("Executing Command", format_command(argv), "debug")
+        process = await asyncio.create_subprocess_exec(
+            *argv,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
         )
-        stdout, stderr = await process.communicate()
-        stdout_str = stdout.decode().strip()
-        stderr_str = stderr.decode().strip()
+        try:
+            async with asyncio.timeout(timeout):
+                stdout, stderr = await process.communicate()
+        except TimeoutError:
+            # Don't leave a hung rusk process behind
+            await stop_process_group(process)
+            log_action(f"Command timed out after {timeout}s", format_command(argv), "error")
+            return None
+        # Strip ANSI escapes before decoding so parsers only ever see plain text
+        stdout_str = _ANSI_BYTES_RE.sub(b'', stdout).decode('utf-8', 'replace').strip()
+        stderr_str = stderr.decode('utf-8', 'replace').strip()
 
         if process.returncode != 0:
-            log_action(f"Command failed with return code {process.returncode}:\n {command.replace(password,'#####')}", stderr_str.replace(password,'#####'),"error")
+            log_action(f"Command failed with return code {process.returncode}:\n {format_command(argv)}", stderr_str.replace(password,'#####'),"error")
             return None # Or raise an exception
         else:
             if log_output and stdout_str:
                 log_action(f"Command output", stdout_str.replace(password,'#####'), 'debug')
             return stdout_str.replace(password,'#####')
     except Exception as e:
-        log_action(f"Error executing command: {command.replace(password,'#####')}", e, "error")
+        log_action(f"Error executing command: {format_command(argv)}", e, "error")
         return None
 
+# argv tuple -> (timestamp, output, in-flight future)
+_cmd_cache = {}
+
+async def cached_cmd(argv, ttl, log_output=True):
+    """
+    Execute a command through execute_command_async, reusing its output for `ttl` seconds.
+    Concurrent callers share a single in-flight subprocess; failed runs are not cached.
+    """
+    command = tuple(argv)
+    cached = _cmd_cache.get(command)
+    if cached:
+        ts, output, pending = cached
+        if pending is not None:
+            return await asyncio.shield(pending)
+        if time.monotonic() - ts < ttl:
+            return output
+
+    pending = asyncio.get_running_loop().create_future()
+    _cmd_cache[command] = (time.monotonic(), None, pending)
+    output = None
+    try:
+        output = await execute_command_async(argv, log_output)
+    finally:
+        if output is None:
+            _cmd_cache.pop(command, None)
+        else:
+            _cmd_cache[command] = (time.monotonic(), output, None)
+        pending.set_result(output)
+    return output
+
+# One shared aiohttp session per event loop; a session can't be used from a loop other than its own
+_sessions = {}
+
+async def get_session():
+    """
+    Return the shared aiohttp session for the running event loop, creating it on first use.
+    """
+    loop_id = id(asyncio.get_running_loop())
+    session = _sessions.get(loop_id)
+    if session is None or session.closed:
+        session = _sessions[loop_id] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, limit_per_host=4, ttl_dns_cache=300, enable_cleanup_closed=True),
+            timeout=aiohttp.ClientTimeout(total=15, connect=5),
+        )
+    return session
+
+async def close_session():
+    """
+    Close the running event loop's shared aiohttp session on shutdown.
+    """
+    session = _sessions.pop(id(asyncio.get_running_loop()), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+# CoinGecko data is reused for this many seconds to stay clear of rate limits
+DUSK_DATA_TTL = 60
+_dusk_data_ts = None  # time.monotonic() of the last successful fetch
+
 async def fetch_dusk_data():
     """
     Fetch DUSK token data from CoinGecko's /coins/markets endpoint and update shared_state.
+    Skips the request if the data was fetched within DUSK_DATA_TTL seconds.
     Logs an error if the request fails or data is incomplete.
     """
+    global _dusk_data_ts
+    if _dusk_data_ts is not None and time.monotonic() - _dusk_data_ts < DUSK_DATA_TTL:
+        return
+
     url = "https://api.coingecko.com/api/v3/coins/markets"
     params = {
         "vs_currency": "usd",  # Convert price to USD
@@ -293,46 +448,47 @@ async def fetch_dusk_data():
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    dusk_data = {}
-                    if data:
-                        dusk_data = data[0]  # Extract the first result for "dusk-network"
-                        
-                    # Update shared_state directly
-                    shared_state["price"] = dusk_data.get("current_price", 0.0)
-                    shared_state["market_cap"] = dusk_data.get("market_cap", 0.0)
-                    shared_state["volume"] = dusk_data.get("total_volume", 0.0)
-                    shared_state["usd_24h_change"] = dusk_data.get("price_change_percentage_24h", 0.0)
-                    shared_state["market_cap_rank"] = dusk_data.get("market_cap_rank", None)
-                    shared_state["circulating_supply"] = dusk_data.get("circulating_supply", None)
-                    shared_state["total_supply"] = dusk_data.get("total_supply", None)
-                    shared_state["ath"] = dusk_data.get("ath", 0.0)
-                    shared_state["ath_change_percentage"] = dusk_data.get("ath_change_percentage", 0.0)
-                    shared_state["price_change_percentage_1h"] = dusk_data.get("price_change_percentage_1h_in_currency", 0.0)
-                    shared_state["last_updated"] = dusk_data.get("last_updated", "N/A")
-                    shared_state["fully_diluted_valuation"] = dusk_data.get("fully_diluted_valuation", 0.0)
-                    shared_state["high_24h"] = dusk_data.get("high_24h", 0.0)
-                    shared_state["low_24h"] = dusk_data.get("low_24h", 0.0)
-                    shared_state["price_change_24h"] = dusk_data.get("price_change_24h", 0.0)
-                    shared_state["market_cap_change_24h"] = dusk_data.get("market_cap_change_24h", 0.0)
-                    shared_state["market_cap_change_percentage_24h"] = dusk_data.get("market_cap_change_percentage_24h", 0.0)
-                    shared_state["max_supply"] = dusk_data.get("max_supply", 0.0)
-                    shared_state["ath_date"] = dusk_data.get("ath_date", 0.0)
-                    shared_state["atl"] = dusk_data.get("atl", 0.0)
-                    shared_state["atl_date"] = dusk_data.get("atl_date", 0.0)
-                    shared_state["price_change_percentage_14d_in_currency"] = dusk_data.get("price_change_percentage_14d_in_currency", 0.0)
-                    shared_state["price_change_percentage_1y_in_currency"] = dusk_data.get("price_change_percentage_1y_in_currency", 0.0)
-                    shared_state["price_change_percentage_200d_in_currency"] = dusk_data.get("price_change_percentage_200d_in_currency", 0.0)
-                    shared_state["price_change_percentage_24h_in_currency"] = dusk_data.get("price_change_percentage_24h_in_currency", 0.0)
-                    shared_state["price_change_percentage_30d_in_currency"] = dusk_data.get("price_change_percentage_30d_in_currency", 0.0)
-                    shared_state["price_change_percentage_7d_in_currency"] = dusk_data.get("price_change_percentage_7d_in_currency", 0.0)
-                    shared_state["price_change_percentage_1h_in_currency"] = dusk_data.get("price_change_percentage_1h_in_currency", 0.0)
+        session = await get_session()
+        async with session.get(url, params=params) as response:
+            if response.status == 200:
+                data = await response.json()
+                dusk_data = {}
+                if data:
+                    dusk_data = data[0]  # Extract the first result for "dusk-network"
                     
-                else:
-                    log_action("Failed to fetch DUSK data", f"HTTP Status: {response.status}", 'debug')
+                # Update shared_state directly
+                shared_state["price"] = dusk_data.get("current_price", 0.0)
+                shared_state["market_cap"] = dusk_data.get("market_cap", 0.0)
+                shared_state["volume"] = dusk_data.get("total_volume", 0.0)
+                shared_state["usd_24h_change"] = dusk_data.get("price_change_percentage_24h", 0.0)
+                shared_state["market_cap_rank"] = dusk_data.get("market_cap_rank", None)
+                shared_state["circulating_supply"] = dusk_data.get("circulating_supply", None)
+                shared_state["total_supply"] = dusk_data.get("total_supply", None)
+                shared_state["ath"] = dusk_data.get("ath", 0.0)
+                shared_state["ath_change_percentage"] = dusk_data.get("ath_change_percentage", 0.0)
+                shared_state["price_change_percentage_1h"] = dusk_data.get("price_change_percentage_1h_in_currency", 0.0)
+                shared_state["last_updated"] = dusk_data.get("last_updated", "N/A")
+                shared_state["fully_diluted_valuation"] = dusk_data.get("fully_diluted_valuation", 0.0)
+                shared_state["high_24h"] = dusk_data.get("high_24h", 0.0)
+                shared_state["low_24h"] = dusk_data.get("low_24h", 0.0)
+                shared_state["price_change_24h"] = dusk_data.get("price_change_24h", 0.0)
+                shared_state["market_cap_change_24h"] = dusk_data.get("market_cap_change_24h", 0.0)
+                shared_state["market_cap_change_percentage_24h"] = dusk_data.get("market_cap_change_percentage_24h", 0.0)
+                shared_state["max_supply"] = dusk_data.get("max_supply", 0.0)
+                shared_state["ath_date"] = dusk_data.get("ath_date", 0.0)
+                shared_state["atl"] = dusk_data.get("atl", 0.0)
+                shared_state["atl_date"] = dusk_data.get("atl_date", 0.0)
+                shared_state["price_change_percentage_14d_in_currency"] = dusk_data.get("price_change_percentage_14d_in_currency", 0.0)
+                shared_state["price_change_percentage_1y_in_currency"] = dusk_data.get("price_change_percentage_1y_in_currency", 0.0)
+                shared_state["price_change_percentage_200d_in_currency"] = dusk_data.get("price_change_percentage_200d_in_currency", 0.0)
+                shared_state["price_change_percentage_24h_in_currency"] = dusk_data.get("price_change_percentage_24h_in_currency", 0.0)
+                shared_state["price_change_percentage_30d_in_currency"] = dusk_data.get("price_change_percentage_30d_in_currency", 0.0)
+                shared_state["price_change_percentage_7d_in_currency"] = dusk_data.get("price_change_percentage_7d_in_currency", 0.0)
+                shared_state["price_change_percentage_1h_in_currency"] = dusk_data.get("price_change_percentage_1h_in_currency", 0.0)
+                _dusk_data_ts = time.monotonic()
+                
+            else:
+                log_action("Failed to fetch DUSK data", f"HTTP Status: {response.status}", 'debug')
     except Exception as e:
         log_action("Error while fetching DUSK data", str(e), 'debug')
 
@@ -340,10 +496,33 @@ async def fetch_dusk_data():
 
 def format_float(value, places=4):
     """Convert float to a string with max 4 (default) decimal digits."""
-    parts = str(convert_to_float(value)).split('.')
-    if len(parts) == 2:
-        return f"{parts[0]}.{parts[1][:places]}" if len(parts[1]) > 0 else parts[0]
-    return parts[0]
+    formatted = f"{convert_to_float(value):.{places}f}"
+    return formatted.rstrip('0').rstrip('.') if '.' in formatted else formatted
+
+_stamp_minute = None  # epoch minute the cached stamp strings below belong to
+_stamp_hm = ''
+_stamp_ymd_hm = ''
+
+def _refresh_minute_stamps(now):
+    """Re-format the minute-resolution stamps only when the minute rolls over."""
+    global _stamp_minute, _stamp_hm, _stamp_ymd_hm
+    minute = int(now) // 60
+    if minute != _stamp_minute:
+        local = time.localtime(now)
+        _stamp_minute = minute
+        _stamp_hm = time.strftime('%H:%M', local)
+        _stamp_ymd_hm = time.strftime('%Y-%m-%d %H:%M', local)
+
+def clock_hms():
+    """Current local time as HH:MM:SS."""
+    now = time.time()
+    _refresh_minute_stamps(now)
+    return f"{_stamp_hm}:{int(now) % 60:02d}"
+
+def log_timestamp():
+    """Current local time as YYYY-MM-DD HH:MM, for log lines."""
+    _refresh_minute_stamps(time.time())
+    return _stamp_ymd_hm
 
 def write_to_log(file_path, message):
     """
@@ -362,13 +541,11 @@ def log_action(action="Action", details="No Details", type='info'):
     """
     
     # Create a timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    timestamp = log_timestamp()
     # Format the message
     formatted_message = LOG_FORMAT.format(timestamp=timestamp, message=f"{action}: {details}")
     
     formatted_message = formatted_message.replace(password, '#####').replace(password, '#####')
-    if len(log_entries) > 15: # TODO: Make configurable
-                log_entries.pop(0)
     
     # Write to the appropriate log file
     if type == 'debug' and enable_logging:
@@ -385,10 +562,40 @@ def log_action(action="Action", details="No Details", type='info'):
         write_to_log(INFO_LOG_FILE, formatted_message)
         log_entries.append(formatted_message)
         
-    notifier.notify(formatted_message, shared_state)
+    queue_notification(formatted_message)
         
     
 
+_notify_queue = asyncio.Queue(maxsize=32)
+
+def queue_notification(message):
+    """
+    Hand a message to notification_worker so slow notification services
+    never block the event loop. Drops the oldest message if the queue is full.
+    """
+    if not notifier.has_sinks():
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # Not running under the event loop yet (startup/config errors), send directly
+        notifier.notify(message, shared_state)
+        return
+    if _notify_queue.full():
+        _notify_queue.get_nowait()
+    _notify_queue.put_nowait(message)
+
+async def notification_worker():
+    """
+    Send queued notifications one at a time in a worker thread.
+    """
+    while True:
+        message = await _notify_queue.get()
+        try:
+            await asyncio.to_thread(notifier.notify, message, shared_state)
+        except Exception as e:
+            log_action("Notification Error", e, "error")
+
 def parse_stake_info(output):
     """
     Parse the output of the 'rusk-wallet --password <password> stake-info' command and
@@ -398,39 +605,21 @@ def parse_stake_info(output):
     If any of the values are missing from the output, return a tuple of (None, None, 0.0).
     """
     try:
-        lines = output.splitlines()
-        eligible_stake = None  # Eligible stake for staking
-        reclaimable_slashed_stake = None  # Reclaimable slashed stake (from penalties)
-        accumulated_rewards = 0.0  # Accumulated rewards from staking
-
-        for line in lines:
-            line = line.strip()
-            if "Eligible stake:" in line:
-                # Example: "Eligible stake: 100.0 DUSK"
-                match = re.search(r"Eligible stake:\s*([\d]+(?:\.\d+)?)\s*DUSK", line)
-                if match:
-                    eligible_stake = convert_to_float(match.group(1))
-            elif "Reclaimable slashed stake:" in line:
-                # Example: "Reclaimable slashed stake: 50.0 DUSK"
-                match = re.search(r"Reclaimable slashed stake:\s*([\d]+(?:\.\d+)?)\s*DUSK", line)
-                if match:
-                    reclaimable_slashed_stake = convert_to_float(match.group(1))
-            elif "Accumulated rewards is:" in line:
-                # Example: "Accumulated rewards is: 10.0 DUSK"
-                match = re.search(r"Accumulated rewards is:\s*([\d]+(?:\.\d+)?)\s*DUSK", line)
-                if match:
-                    accumulated_rewards = convert_to_float(match.group(1))
-            elif "Stake active from block #" in line:
-                # Example: "Stake active from block #123456"
-                match = re.search(r"#(\d+)", line)
-                if match:
-                    stake_active_blk = int(match.group(1))
-                    shared_state["active_blk"] = stake_active_blk
+        # Example: "Eligible stake: 100.0 DUSK" -> {"Eligible stake": 100.0}
+        found = {label: convert_to_float(amount) for label, amount in _STAKE_RE.findall(output)}
+        eligible_stake = found.get("Eligible stake")  # Eligible stake for staking
+        reclaimable_slashed_stake = found.get("Reclaimable slashed stake")  # Reclaimable slashed stake (from penalties)
+        accumulated_rewards = found.get("Accumulated rewards is", 0.0)  # Accumulated rewards from staking
+
+        # Example: "Stake active from block #123456"
+        match = _ACTIVE_BLK_RE.search(output)
+        if match:
+            shared_state["active_blk"] = int(match.group(1))
 
         if (eligible_stake is None or
             reclaimable_slashed_stake is None):
             # If we couldn't parse the stake-info output fully, log an error
-            log_action("Incomplete stake-info values.",f"Could not parse fully.\n{lines}", "error")
+            log_action("Incomplete stake-info values.",f"Could not parse fully.\n{output}", "error")
             return None, None, 0.0
 
         # Return the parsed values
@@ -439,6 +628,16 @@ def parse_stake_info(output):
         log_action(f"Error parsing stake-info output: ",e,"error")
         return None, None, 0.0
 
+# Limit concurrent rusk-wallet processes (each one decrypts the wallet)
+wallet_cmd_limit = asyncio.Semaphore(4)
+
+async def fetch_stake_info():
+    """
+    Cached stake-info output, counted against wallet_cmd_limit like the balance lookups.
+    """
+    async with wallet_cmd_limit:
+        return await cached_cmd(CMD_STAKE_INFO, 60)
+
 async def get_wallet_balances(password, first_run=False):
     """
     Fetches the wallet balances for public and shielded addresses.
@@ -454,22 +653,14 @@ async def get_wallet_balances(password, first_run=False):
             "shielded": []
         }
 
-        cmd_profiles = f"{use_sudo} rusk-wallet --password {password} profiles"
-        output_profiles = await execute_command_async(cmd_profiles)
+        output_profiles = await execute_command_async(CMD_PROFILES)
         if not output_profiles:
             return 0.0, 0.0
 
         # Parse addresses
-        for line in output_profiles.splitlines():
-            line = line.strip()
-            if "Shielded account" in line:
-                match = re.search(r"Shielded account\s*-\s*(\S+)", line)
-                if match:
-                    addresses["shielded"].append(match.group(1))
-            elif "Public account" in line:
-                match = re.search(r"Public account\s*-\s*(\S+)", line)
-                if match:
-                    addresses["public"].append(match.group(1))
+        for match in _PROFILE_RE.finditer(output_profiles):
+            kind = "shielded" if match.group(1) == "Shielded" else "public"
+            addresses[kind].append(match.group(2))
     except Exception as e:
         log_action(
             f"Error in get_wallet_balances(): ",
@@ -483,9 +674,10 @@ async def get_wallet_balances(password, first_run=False):
         """
         Fetches the spendable balance for the given address
         """
-        cmd_balance = f"{use_sudo} rusk-wallet --password {password} balance --spendable --address {addr}"
+        cmd_balance = (*CMD_BALANCE, addr)
         try:
-            out = await execute_command_async(cmd_balance)
+            async with wallet_cmd_limit:
+                out = await execute_command_async(cmd_balance)
             if out:
                 total_str = out.replace("Total: ", "")
                 return float(total_str)
@@ -503,14 +695,13 @@ async def get_wallet_balances(password, first_run=False):
 
         return 0.0
 
-    tasks_public = [get_spendable_for_address(addr) for addr in addresses["public"]]
-    tasks_shielded = [get_spendable_for_address(addr) for addr in addresses["shielded"]]
-
-    results_public = await asyncio.gather(*tasks_public)
-    results_shielded = await asyncio.gather(*tasks_shielded)
+    results = await asyncio.gather(
+        *(get_spendable_for_address(addr) for addr in addresses["public"] + addresses["shielded"])
+    )
+    public_count = len(addresses["public"])
 
-    new_public_total = sum(results_public)
-    new_shielded_total = sum(results_shielded)
+    new_public_total = sum(results[:public_count])
+    new_shielded_total = sum(results[public_count:])
 
     # Check for balance changes
     old_public_total = shared_state.get("balances", {}).get("public", 0.0)
@@ -539,12 +730,10 @@ async def get_wallet_balances(password, first_run=False):
 
 def calculate_rewards_per_epoch(rewards_amount, last_claim_block, current_block):
     """Estimate how many rewards are generated per epoch (2160 blocks) since last claim."""
-    
     blocks_elapsed = current_block - last_claim_block
-    epochs_elapsed = blocks_elapsed / 2160
-    if epochs_elapsed > 0:
-        return rewards_amount / epochs_elapsed
-    return 0.0
+    if blocks_elapsed <= 0:
+        return 0.0
+    return rewards_amount * 2160 / blocks_elapsed
 
 def calculate_downtime_loss(rewards_per_epoch, downtime_epochs=1):
     """Calculate downtime loss for unstaking and restaking."""
@@ -582,19 +771,15 @@ def format_hms(seconds):
 async def sleep_with_feedback(seconds_to_sleep, msg=None):
     """
     Asynchronous version of sleep with visual feedback.
-    Updates shared_state['remain_time'] for real-time display.
+    Publishes the deadline in shared_state; readers use remaining_time() for the countdown.
     """
     completion_time = (datetime.now() + timedelta(seconds=seconds_to_sleep)).strftime('%H:%M')
 
-    shared_state["remain_time"] = seconds_to_sleep
+    shared_state["sleep_deadline"] = time.monotonic() + seconds_to_sleep
     shared_state["completion_time"] = "@ " + completion_time
-    
-    while shared_state["remain_time"] > 0:
-        interval = min(1, shared_state["remain_time"])
-        
-        await asyncio.sleep(interval)
-        shared_state["remain_time"] -= interval
-        
+
+    await asyncio.sleep(seconds_to_sleep)
+
 
 async def sleep_until_next_epoch(block_height, buffer_blocks=60, msg=None):
     """
@@ -627,94 +812,125 @@ async def sleep_until_next_epoch(block_height, buffer_blocks=60, msg=None):
 # FREQUENT UPDATE LOOP (every 10 seconds) for display
 # ─────────────────────────────────────────────────────────────────────────────
 
+BLOCK_TIME = 10              # Seconds between blocks
+MAX_POLL_INTERVAL = 30       # Cap for polling backoff while the block height is unchanged
+STALL_WARNING_SECS = 100     # Warn when the block height hasn't changed for this long
+LOW_PEERS_WARNING_SECS = 2400  # Warn when the peer count has been low for this long
+BALANCE_REFRESH_SECS = 200   # How often balances, stake-info and price are refreshed
+
+def next_poll_delay(last_change_ts, no_change_polls):
+    """
+    Seconds to wait before polling the block height again.
+    After a new block, wake just after the next one is expected; while the height
+    is unchanged, back off exponentially from BLOCK_TIME up to MAX_POLL_INTERVAL.
+    Never polls sooner than a block, which also keeps clear of the height cache TTL.
+    """
+    if no_change_polls:
+        return min(MAX_POLL_INTERVAL, BLOCK_TIME * 2 ** (no_change_polls - 1))
+    return max(1, BLOCK_TIME - ((time.monotonic() - last_change_ts) % BLOCK_TIME))
+
+def retry_delay(fail_count):
+    """Seconds to wait before retrying after `fail_count` consecutive failures (10s doubling, max 5m)."""
+    return min(300, 10 * 2 ** fail_count)
+
 async def frequent_update_loop():
     """
-    Update the block height and balances every 20 seconds.
+    Update the block height every block and balances every few minutes.
     Checks if the block height changes to ensure node responsiveness.
     """
 
-    loopcnt = 0
-    consecutive_no_change = 0  # Counter for consecutive no-change in block height
+    last_refresh = time.monotonic()  # Last balance/stake-info/price refresh
+    last_change_ts = time.monotonic()  # When the block height last changed
+    no_change_polls = 0  # Polls in a row that returned the same block height
     last_known_block_height = None  # Track the last block height
-    consecutive_low_peers = 0 # Track loops of low peer counts
+    low_peers_since = None # When the peer count dropped below min_peers
+    fail_count = 0 # Consecutive failed fetches, for retry backoff
     
     while True:
             
-            # 1) Fetch block height
-            block_height_str = await execute_command_async(f"{use_sudo} ruskquery block-height", False)
+            # 1) Fetch block height and peer count together
+            block_height_str, peer_str = await asyncio.gather(
+                cached_cmd(CMD_BLOCK_HEIGHT, 5, False),
+                cached_cmd(CMD_PEERS, 30, False),
+            )
             if not block_height_str:
-                log_action("Failed to fetch block height.", ' Retrying in 10s...', "error")
-                await asyncio.sleep(10)
+                delay = retry_delay(fail_count)
+                fail_count += 1
+                log_action("Failed to fetch block height.", f' Retrying in {delay}s...', "error")
+                await asyncio.sleep(delay)
                 continue
             
             current_block_height = int(block_height_str)
+            now = time.monotonic()
             
             # Compare with last known block height
-            if last_known_block_height is not None:
-                if current_block_height == last_known_block_height:
-                    consecutive_no_change += 1
-                else:
-                    consecutive_no_change = 0  # Reset counter if block height changes
+            if current_block_height != last_known_block_height:
+                last_change_ts = now
+                no_change_polls = 0
             else:
-                consecutive_no_change = 0  # Reset counter on first valid block height
+                no_change_polls += 1
             
-            # Log and notify if block height hasn't changed for 10 loops (100 seconds)
-            if consecutive_no_change >= 10:
-                message = f"WARNING! Block height has not changed for {consecutive_no_change * 10} seconds.\nLast height: {last_known_block_height}"
+            # Log and notify if block height hasn't changed for too long
+            if now - last_change_ts >= STALL_WARNING_SECS:
+                message = f"WARNING! Block height has not changed for {int(now - last_change_ts)} seconds.\nLast height: {last_known_block_height}"
                 log_action("Block Height Error!", message,"error")
                 
-                consecutive_no_change = 0  # Reset after notifying to avoid spamming
-                await asyncio.sleep(1)
-                continue # Need to double check this
+                last_change_ts = now  # Reset after notifying to avoid spamming
 
             # Update last known block height and shared state
             last_known_block_height = current_block_height
             shared_state["block_height"] = current_block_height
             
-            # Perform balance and stake-info updates every X  loops (e.g., 30 is 5 minutes)
-            if loopcnt >= 20 and not stake_checking:
-                pub_bal, shld_bal = await get_wallet_balances(password)
+            # Perform balance and stake-info updates every BALANCE_REFRESH_SECS
+            if now - last_refresh >= BALANCE_REFRESH_SECS and not stake_checking:
+                # These don't depend on each other, so run them concurrently
+                (pub_bal, shld_bal), stake_output, _ = await asyncio.gather(
+                    get_wallet_balances(password),
+                    fetch_stake_info(),
+                    fetch_dusk_data(),
+                )
                 shared_state["balances"]["public"] = pub_bal or 0.0
                 shared_state["balances"]["shielded"] = shld_bal or 0.0
                 
-                stake_output = await execute_command_async(f"{use_sudo} rusk-wallet --password {password} stake-info")
                 if stake_output:
                     e_stake, r_slashed, a_rewards = parse_stake_info(stake_output)
                     shared_state["stake_info"]["stake_amount"] = e_stake or 0.0
                     shared_state["stake_info"]["reclaimable_slashed_stake"] = r_slashed or 0.0
                     shared_state["stake_info"]["rewards_amount"] = a_rewards or 0.0
-                
-                await fetch_dusk_data()  
                     
-                loopcnt = 0  # Reset loop count after update
+                last_refresh = now
             
             
-            shared_state["peer_count"] = await execute_command_async(f"{use_sudo} ruskquery peers", False)
-            peer_count = int(shared_state["peer_count"])
+            try:
+                peer_count = int(peer_str or 0)
+            except ValueError:
+                peer_count = 0
             
             if not peer_count:
-                log_action("Failed to fetch peers.", "Retrying in 10s...", "error")
-                await asyncio.sleep(10)
+                # Keep the last good count published; the display and dashboard read it every tick
+                delay = retry_delay(fail_count)
+                fail_count += 1
+                log_action("Failed to fetch peers.", f"Retrying in {delay}s...", "error")
+                await asyncio.sleep(delay)
                 continue
+            fail_count = 0
+            shared_state["peer_count"] = peer_str
             
             # check peer count
-            if peer_count is not None:
-                if peer_count < min_peers or peer_count <=0:
-                    consecutive_low_peers += 1
-                else:
-                    consecutive_low_peers = 0  # Reset counter if block height changes
+            if peer_count < min_peers or peer_count <=0:
+                if low_peers_since is None:
+                    low_peers_since = now
             else:
-                consecutive_low_peers = 0  # Reset counter on first valid block height
+                low_peers_since = None  # Reset once the peer count recovers
             
             # Log and notify if low count for too long
-            if consecutive_low_peers >= 240:
-                message = f"WARNING! Low peer count for {consecutive_low_peers * 10} seconds.\nCurrent Count: {peer_count}"
+            if low_peers_since is not None and now - low_peers_since >= LOW_PEERS_WARNING_SECS:
+                message = f"WARNING! Low peer count for {int(now - low_peers_since)} seconds.\nCurrent Count: {peer_count}"
                 log_action("Low peer count!", message, "error")
                 
-                consecutive_low_peers = 0  # Reset after notifying to avoid spamming
+                low_peers_since = now  # Reset after notifying to avoid spamming
 
-            loopcnt += 1
-            await asyncio.sleep(10)  # Wait 10 seconds before the next loop
+            await asyncio.sleep(next_poll_delay(last_change_ts, no_change_polls))
 
 async def init_balance():
     """
@@ -724,7 +940,7 @@ async def init_balance():
     await fetch_dusk_data() # grab data from Coingecko
 
     # Fetch block height
-    block_height_str = await execute_command_async(f"{use_sudo} ruskquery block-height", False)
+    block_height_str = await cached_cmd(CMD_BLOCK_HEIGHT, 5, False)
     if block_height_str:
         shared_state["block_height"] = int(block_height_str)
     # Fetch wallet balances
@@ -744,16 +960,19 @@ async def stake_management_loop():
     """
 
     first_run = True
+    fail_count = 0 # Consecutive failed fetches, for retry backoff
 
     while True:
         try:
             stake_checking = True     
             # For logic, we may want a fresh block height right before we do anything:
-            block_height_str = await execute_command_async(f"{use_sudo} ruskquery block-height", False)
+            block_height_str = await cached_cmd(CMD_BLOCK_HEIGHT, 5, False)
             if not block_height_str:
-                log_action("Failed to fetch block height", "Retrying in 30s...", "error")
+                delay = retry_delay(fail_count)
+                fail_count += 1
+                log_action("Failed to fetch block height", f"Retrying in {delay}s...", "error")
                 stake_checking = False
-                await sleep_with_feedback(30, "retry block height fetch")
+                await sleep_with_feedback(delay, "retry block height fetch")
                 
                 continue
 
@@ -768,12 +987,15 @@ async def stake_management_loop():
                 continue
 
             # Fetch stake-info
-            stake_output = await execute_command_async(f"{use_sudo} rusk-wallet --password {password} stake-info")
+            stake_output = await fetch_stake_info()
             if not stake_output:
-                log_action("Error", "Failed to fetch stake-info. Retrying in 60s...", "error")
+                delay = retry_delay(fail_count)
+                fail_count += 1
+                log_action("Error", f"Failed to fetch stake-info. Retrying in {delay}s...", "error")
                 stake_checking = False
-                await sleep_with_feedback(30, "retry stake-info fetch")
+                await sleep_with_feedback(delay, "retry stake-info fetch")
                 continue
+            fail_count = 0
 
             e_stake, r_slashed, a_rewards = parse_stake_info(stake_output)
             if e_stake is None or r_slashed is None or a_rewards is None:
@@ -784,9 +1006,11 @@ async def stake_management_loop():
             
             
             # Update in shared state
-            shared_state["stake_info"]["stake_amount"] = e_stake
-            shared_state["stake_info"]["reclaimable_slashed_stake"] = r_slashed
-            shared_state["stake_info"]["rewards_amount"] = a_rewards
+            shared_state["stake_info"].update(
+                stake_amount=e_stake,
+                reclaimable_slashed_stake=r_slashed,
+                rewards_amount=a_rewards,
+            )
 
             stake_checking = False
             # For logic thresholds
@@ -821,31 +1045,28 @@ async def stake_management_loop():
                     
                     # 1) Withdraw
                 
-                    curr_cmd = f"{use_sudo} rusk-wallet --password ####### withdraw"
-                    curr2 = curr_cmd
-                    cmd_success = await execute_command_async(curr_cmd.replace('#######',password))
+                    curr_cmd = CMD_WITHDRAW
+                    cmd_success = await execute_command_async(curr_cmd, timeout=None)
                     if not cmd_success:
-                        log_action(f"Withdraw Failed (Block #{block_height})", f"Command: {curr2}", 'error')
+                        log_action(f"Withdraw Failed (Block #{block_height})", f"Command: {format_command(curr_cmd)}", 'error')
                         raise Exception("CMD execution failed")
                     if 'Withdrawing 0 reward is not allowed' in cmd_success:
                         rewards_amount = 0.0
                     
                     # 2) Unstake
                 
-                    curr_cmd =f"{use_sudo} rusk-wallet --password ####### unstake"
-                    curr2 = curr_cmd
-                    cmd_success = await execute_command_async(curr_cmd.replace('#######',password))
+                    curr_cmd = CMD_UNSTAKE
+                    cmd_success = await execute_command_async(curr_cmd, timeout=None)
                     if not cmd_success or 'rror' in cmd_success:
-                        log_action(f"Withdraw Failed (Block #{block_height})", f"Command: {curr2}", 'error')
+                        log_action(f"Withdraw Failed (Block #{block_height})", f"Command: {format_command(curr_cmd)}", 'error')
                         raise Exception("CMD execution failed")
                     
                     # 3) Stake
                     total_restake = stake_amount + rewards_amount + reclaimable_slashed_stake
-                    curr_cmd = f"{use_sudo} rusk-wallet --password ####### stake --amt {total_restake}"
-                    curr2 = curr_cmd
-                    cmd_success = await execute_command_async(curr_cmd.replace('#######', password))
+                    curr_cmd = (*CMD_STAKE, str(total_restake))
+                    cmd_success = await execute_command_async(curr_cmd, timeout=None)
                     if not cmd_success or 'rror' in cmd_success:
-                        log_action(f"Withdraw Failed (Block #{block_height})", f"Command: {curr2}", 'error')
+                        log_action(f"Withdraw Failed (Block #{block_height})", f"Command: {format_command(curr_cmd)}", 'error')
                         raise Exception("CMD execution failed")
 
                     log_action("Restake Completed", f"New Stake: {format_float(float(total_restake))}")
@@ -858,28 +1079,27 @@ async def stake_management_loop():
 
             elif should_claim_and_stake(rewards_amount, incremental_threshold) and not first_run:
                 # Claim & Stake
-                shared_state["last_action_taken"] = f"Claim/Stake @ Block {block_height}"
+                act_msg = f"Claim/Stake @ Block {block_height}"
+                shared_state["last_action_taken"] = act_msg
                 log_action(
-                    shared_state["last_action_taken"],
+                    act_msg,
                     f"Rwd: {format_float(rewards_amount)}, Stk: {format_float(stake_amount)}, Rcl: {format_float(reclaimable_slashed_stake)}"
                 )
 
                 # 1) Withdraw
                 
-                curr_cmd = f"{use_sudo} rusk-wallet --password ####### withdraw"
-                curr2 = curr_cmd
-                cmd_success = await execute_command_async(curr_cmd.replace('#######',password))
+                curr_cmd = CMD_WITHDRAW
+                cmd_success = await execute_command_async(curr_cmd, timeout=None)
                 if not cmd_success or 'rror' in cmd_success:
-                        log_action(f"Withdraw Failed (Block #{block_height})", f"Command: {curr2}", 'error')
+                        log_action(f"Withdraw Failed (Block #{block_height})", f"Command: {format_command(curr_cmd)}", 'error')
                         raise Exception("CMD execution failed")
                     
                 # 2) Stake
                 
-                curr_cmd = f"{use_sudo} rusk-wallet --password ####### stake --amt {rewards_amount}"
-                curr2 = curr_cmd
-                cmd_success = await execute_command_async(curr_cmd.replace('#######',password))
+                curr_cmd = (*CMD_STAKE, str(rewards_amount))
+                cmd_success = await execute_command_async(curr_cmd, timeout=None)
                 if not cmd_success or 'rror' in cmd_success:
-                        log_action(f"Withdraw Failed (Block #{block_height})", f"Command: {curr2}", 'error')
+                        log_action(f"Withdraw Failed (Block #{block_height})", f"Command: {format_command(curr_cmd)}", 'error')
                         raise Exception("CMD execution failed")
                     
                 new_stake = stake_amount + rewards_amount
@@ -894,9 +1114,6 @@ async def stake_management_loop():
                 shared_state["last_no_action_block"] = block_height
                 shared_state["last_action_taken"] = f"No Action @ Block {block_height}"
                 
-                b = shared_state["balances"]
-                now_ts = datetime.now().strftime('%Y-%m-%d %H:%M')
-                
                 # block_height = shared_state["block_height"]
                 if first_run:
                     shared_state["last_action_taken"] = f"Startup @ Block #{block_height}"
@@ -907,22 +1124,30 @@ async def stake_management_loop():
                     await sleep_until_next_epoch(block_height, buffer_blocks=buffer_blocks)
                     continue    
                 
+            # Reached on the startup pass and when an unstake/restake is skipped for being below
+            # min_stake_amount (any pass); every other branch above continues before this point
             action = shared_state["last_action_taken"]
+            now_ts = log_timestamp()
+            b = shared_state["balances"]
+            price = convert_to_float(shared_state["price"])
+            st_info = shared_state.get('stake_info', {})
+            pub, shd = b['public'], b['shielded']
+            stk = convert_to_float(st_info.get('stake_amount', 0.0))
+            rwd = convert_to_float(st_info.get('rewards_amount', 0.0))
+            rcl = convert_to_float(st_info.get('reclaimable_slashed_stake', 0.0))
             Log_info = (
             f"\t==== Activity @{now_ts}====\n"
             f"  Action              :  {action}\n\n"
-            f"  Balance           :  {format_float(b['public'] + b['shielded'],)}\n"
-            f"    ├─ Public      :    {format_float(b['public'])} (${format_float(b['public'] * float(shared_state["price"]))})\n"
-            f"    └─ Shielded  :    {format_float(b['shielded'])} (${format_float(b['shielded'] * float(shared_state["price"]))})\n\n"
-            f"  Staked              :  {format_float(shared_state.get('stake_info',{}).get('stake_amount','0.0'))} (${format_float(shared_state.get('stake_info',{}).get('stake_amount','0.0') * float(shared_state["price"]))})\n"
-            f"  Rewards           :  {format_float(shared_state.get('stake_info',{}).get('rewards_amount','0.0'))} (${format_float(shared_state.get('stake_info',{}).get('rewards_amount',{}) * float(shared_state["price"]))})\n"
-            f"  Reclaimable    :  {format_float(shared_state.get('stake_info',{}).get('reclaimable_slashed_stake','0.0'))} (${format_float(shared_state.get('stake_info',{}).get('reclaimable_slashed_stake') * float(shared_state["price"]))})\n"
+            f"  Balance           :  {format_float(pub + shd)}\n"
+            f"    ├─ Public      :    {format_float(pub)} (${format_float(pub * price)})\n"
+            f"    └─ Shielded  :    {format_float(shd)} (${format_float(shd * price)})\n\n"
+            f"  Staked              :  {format_float(stk)} (${format_float(stk * price)})\n"
+            f"  Rewards           :  {format_float(rwd)} (${format_float(rwd * price)})\n"
+            f"  Reclaimable    :  {format_float(rcl)} (${format_float(rcl * price)})\n"
                 )
             
-            if len(log_entries) > 15: # TODO: Make configurable
-                log_entries.pop(0)
             log_entries.append(Log_info)
-            notifier.notify(Log_info, shared_state) # 
+            queue_notification(Log_info)
             
             first_run = False
             stake_checking = False
@@ -939,6 +1164,163 @@ async def stake_management_loop():
 # REAL-TIME DISPLAY
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Display templates with the colors baked in once; only the {slots} are filled per refresh
+_TOP_BAR_TEMPLATE = (
+    f" {LIGHT_WHITE}======={DEFAULT} {{time}} Block: {LIGHT_BLUE}#{{blk}} {DEFAULT}(E: {LIGHT_BLUE}{{epoch}}{DEFAULT}) "
+    f"Peers: {{peercolor}}{{peers}}{DEFAULT} {LIGHT_WHITE}=======\n"
+)
+
+_RT_TEMPLATE = (
+    "{opts}\n"
+    "{top_bar}"
+    f"    {CYAN}Last Action{DEFAULT}   | {CYAN}{{last_act}}{DEFAULT}\n"
+    f"    {LIGHT_GREEN}Next Check    {DEFAULT}| {{charclr}}{{disp_time}}{DEFAULT} ({{donetime}}){DEFAULT}\n"
+    f"{DEFAULT}                  |\n"
+    f"    {LIGHT_WHITE}Price USD{DEFAULT}     | {LIGHT_WHITE}${{price}}{DEFAULT} {{chg24}}\n"
+    f"                  {DEFAULT}| 7d: {{chg7d:.2f}}% 30d: {{chg30d:.2f}}% 1y: {{chg1y:.2f}}%\n"
+    f"{DEFAULT}                  |\n"
+    f"    {LIGHT_WHITE}Balance{DEFAULT}       | {LIGHT_WHITE}{{allocation_bar}}\n"
+    f"      {LIGHT_WHITE}├─ {YELLOW}Public   {DEFAULT}| {YELLOW}{{pub}} (${{pub_usd:,.2f}}){DEFAULT}\n"
+    f"      {LIGHT_WHITE}└─ {BLUE}Shielded {DEFAULT}| {BLUE}{{shd}} (${{shd_usd:,.2f}}){DEFAULT}\n"
+    f"         {LIGHT_WHITE}   Total {DEFAULT}| {LIGHT_WHITE}{{tot}} DUSK (${{tot_usd:,.2f}}){DEFAULT}\n"
+    f"{DEFAULT}                  |\n"
+    f"    {LIGHT_WHITE}Staked{DEFAULT}        | {LIGHT_WHITE}{{stk}} (${{stk_usd:,.2f}}){DEFAULT}{{is_active}}\n"
+    f"    {YELLOW}Rewards{DEFAULT}       | {YELLOW}{{rwd}} ({LIGHT_BLUE}{{reward_percent:.4f}}%{DEFAULT}) (${{rwd_usd:,.2f}}) {LIGHT_WHITE}{{per_epoch}}{DEFAULT}\n"
+    f"    {LIGHT_RED}Reclaimable{DEFAULT}   | {LIGHT_RED}{{rcl}} (${{rcl_usd:,.2f}}){DEFAULT}\n"
+    f" {LIGHT_WHITE}{{footer}}{DEFAULT}\n"
+)
+
+_BYLINE_WIDTH = len(remove_ansi(byline))
+
+# Rich styles for the display's own color codes, as (resets previous style, style).
+# Mapping them directly skips Rich's general-purpose ANSI decoder on every refresh.
+_ANSI_STYLES = {
+    RED: (True, Style(color="red")),
+    GREEN: (True, Style(color="green")),
+    BLUE: (True, Style(color="blue")),
+    CYAN: (True, Style(color="cyan")),
+    LIGHT_RED: (False, Style(bold=True, color="red")),
+    LIGHT_GREEN: (False, Style(bold=True, color="green")),
+    YELLOW: (False, Style(bold=True, color="yellow")),
+    LIGHT_BLUE: (False, Style(bold=True, color="blue")),
+    LIGHT_WHITE: (False, Style(bold=True, color="white")),
+    DEFAULT: (False, Style(bold=True, color="default")),
+    UNDERLINE: (False, Style(underline=True)),
+    END_UNDERLINE: (True, Style()),
+}
+_ANSI_SPLIT_RE = re.compile('(' + '|'.join(re.escape(code) for code in _ANSI_STYLES) + ')')
+
+@lru_cache(maxsize=128)
+def _ansi_line(line):
+    """Decode one display line into a Rich Text; unchanged lines are reused between refreshes."""
+    text = Text()
+    style = Style()
+    for i, part in enumerate(_ANSI_SPLIT_RE.split(line)):
+        if i % 2:
+            reset, code_style = _ANSI_STYLES[part]
+            style = code_style if reset else style + code_style
+        elif part:
+            if '\x1b' in part:
+                # An escape sequence this display doesn't emit itself, let Rich decode the line
+                return Text.from_ansi(line)
+            text.append(part, style)
+    return text
+
+def ansi_to_text(content):
+    """Decode the display line by line so only the lines that changed get re-parsed."""
+    return Text("\n").join(_ansi_line(line) for line in content.split("\n"))
+
+# Countdown/peer color thresholds: values up to and including each bound take that color
+_REMAIN_BUCKETS = (3600, 7200, 10800)
+_REMAIN_COLORS = (RED, YELLOW, GREEN, LIGHT_WHITE)
+_PEER_BUCKETS = (16, 40)
+_PEER_COLORS = (RED, YELLOW, LIGHT_GREEN)
+
+_CHG24_UP = f"{GREEN}{{:.2f}}% 24h"
+_CHG24_DOWN = f"{RED}{{:.2f}}% 24h"
+_CHG24_FLAT = f"{DEFAULT}{{:.2f}}% 24h"
+
+# tmux status fields in display order, paired with their STATUSBAR config toggle
+_TMUX_FIELDS = (
+    ('curblk', 'show_current_block'),
+    ('stk', 'show_staked'),
+    ('rcl', 'show_reclaimable'),
+    ('rwd', 'show_rewards'),
+    ('bal', 'show_total'),
+    ('p', 'show_public'),
+    ('s', 'show_shielded'),
+    ('usd', 'show_price'),
+    ('timer', 'show_timer'),
+    ('donetime', 'show_trigger_time'),
+    ('peercnt', 'show_peer_count'),
+)
+
+_TMUX_FRAGMENTS = {
+    'curblk': "Blk: #{blk} | ",
+    'stk': "Stk: {stk} | ",
+    'rcl': "Rcl: {rcl} | ",
+    'rwd': "Rwd: {rwd} | ",
+    'usd': "$USD: {price} {chg24} | ",
+    'timer': "Next: {timer} ",
+    'donetime': "({donetime}) ",
+    'peercnt': "Peers: {peers}",
+}
+
+@lru_cache(maxsize=None)
+def _build_tmux_template(flags):
+    """Build the tmux status format string containing only the enabled fields."""
+    shown = dict(zip((key for key, _ in _TMUX_FIELDS), flags))
+    parts = ["> "]
+    for key in ('curblk', 'stk', 'rcl', 'rwd'):
+        if shown[key]:
+            parts.append(_TMUX_FRAGMENTS[key])
+
+    balances = [frag for key, frag in (('p', "P:{pub}"), ('s', "S:{shd}")) if shown[key]]
+    if balances:
+        if shown['bal']:
+            parts.append("Bal: ")
+        parts.append("  ".join(balances) + " | ")
+
+    for key in ('usd', 'timer', 'donetime', 'peercnt'):
+        if shown[key]:
+            parts.append(_TMUX_FRAGMENTS[key])
+    parts.append(" {error}")
+    return "".join(parts)
+
+async def open_tmux_control():
+    """
+    Start a long-lived tmux control-mode client for status-bar updates, attached to
+    the session this process runs in. Returns the process, or None when not running
+    inside tmux or tmux could not be started (callers fall back to one-shot commands).
+    """
+    pane = os.environ.get("TMUX_PANE")
+    if not os.environ.get("TMUX") or not pane:
+        return None
+    try:
+        return await asyncio.create_subprocess_exec(
+            "tmux", "-C", "attach", "-t", pane,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError as e:
+        log_action("tmux Error", f"Failed to start tmux control client: {e}", "debug")
+        return None
+
+async def set_tmux_status(tmux_ctl, status):
+    """
+    Set the tmux status-left through the control client.
+    Returns False if the client has gone away and the caller should fall back.
+    """
+    if tmux_ctl is None or tmux_ctl.returncode is not None:
+        return False
+    try:
+        tmux_ctl.stdin.write(f"set-option -g status-left {shlex.quote(status)}\n".encode())
+        await tmux_ctl.stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        return False
+    return True
+
 async def realtime_display(tmux=False):
     """
     Continuously display real-time info in the console.
@@ -946,181 +1328,177 @@ async def realtime_display(tmux=False):
     """
     first_run = True
     enable_tmux = tmux
+    tmux_flags = tuple(status_bar.get(option, True) for _, option in _TMUX_FIELDS)
 
-    with Live(console=console, refresh_per_second=4, auto_refresh=False) as live:
-        while True:
-            try:
-                blk = shared_state["block_height"]
-                st_info = shared_state["stake_info"]
-                b = shared_state["balances"]
-                last_act = shared_state["last_action_taken"]
-                remain_seconds = shared_state["remain_time"]
-                disp_time = format_hms(remain_seconds) if remain_seconds > 0 else "0s"
-                donetime = shared_state["completion_time"]
-                if donetime == '--:--':
-                    await asyncio.sleep(2)
-                    continue
-                tot_bal = b["public"] + b["shielded"]
-                price = shared_state["price"]
-                
-                charclr =str()
-                charclr = (
-                    RED if remain_seconds <= 3600 else
-                    YELLOW if remain_seconds <= 7200 else
-                    GREEN if remain_seconds <= 10800 else
-                    LIGHT_WHITE
-                )
-                    
-                timer = f"Next:{charclr} {disp_time} "
-                chg24 = f"{GREEN if shared_state['usd_24h_change'] > 0 else RED if shared_state['usd_24h_change'] < 0 else DEFAULT}{shared_state['usd_24h_change']:.2f}% 24h"
-                usd = f"$USD: {format_float(shared_state['price'],3)} {chg24} | "
-                
-                peercolor = next(
-                    color for color, condition in {
-                        RED: lambda x: x <= 16,
-                        YELLOW: lambda x: 16 < x <= 40,
-                        LIGHT_GREEN: lambda x: x > 40
-                    }.items() if condition(int(shared_state['peer_count']))
-)
+    tmux_ctl = await open_tmux_control() if enable_tmux else None
+    last_frame_key = None
+    last_tmux_status = None
+
+    live_display = Live(console=get_console(), refresh_per_second=4, auto_refresh=False, screen=alt_screen) if display_gui else nullcontext()
+    try:
+        with live_display as live:
+            while True:
+                try:
+                    blk = shared_state["block_height"]
+                    st_info = shared_state["stake_info"]
+                    b = shared_state["balances"]
+                    last_act = shared_state["last_action_taken"]
+                    remain_seconds = remaining_time(shared_state)
+                    # Refresh every second only during the last hour before the next check
+                    refresh_secs = 1 if remain_seconds <= 3600 else idle_refresh
+                    disp_time = format_hms(remain_seconds) if remain_seconds > 0 else "0s"
+                    donetime = shared_state["completion_time"]
+                    if donetime == '--:--':
+                        await asyncio.sleep(2)
+                        continue
+                    price = convert_to_float(shared_state["price"])
+                    chg = convert_to_float(shared_state["usd_24h_change"])
+                    chg7d = shared_state.get("price_change_percentage_7d_in_currency", 0.0)
+                    chg30d = shared_state.get("price_change_percentage_30d_in_currency", 0.0)
+                    chg1y = shared_state.get("price_change_percentage_1y_in_currency", 0.0)
+                    peer_count = int(shared_state["peer_count"])
+                    active_block = shared_state.get("active_blk", 2160)
+                    rpe = convert_to_float(shared_state.get("rewards_per_epoch", 0.0))
+                    last_claim = int(shared_state.get("last_claim_block", 0))
+                    pub, shd = b["public"], b["shielded"]
+                    tot_bal = pub + shd
+                    stk = st_info['stake_amount']
+                    rwd = st_info['rewards_amount']
+                    rcl = st_info['reclaimable_slashed_stake']
+                    currenttime = clock_hms()
+
+                    # Everything except the clock and countdown is only rebuilt when one of these changes
+                    frame_key = (
+                        blk, last_act, donetime, price, pub, shd, stk, rwd, rcl,
+                        peer_count, chg, chg7d, chg30d, chg1y, active_block, rpe, last_claim, errored,
+                    )
+                    if frame_key != last_frame_key:
+                        chg24 = (_CHG24_UP if chg > 0 else _CHG24_DOWN if chg < 0 else _CHG24_FLAT).format(chg)
+                        peercolor = _PEER_COLORS[bisect.bisect_left(_PEER_BUCKETS, peer_count)]
 
-                currenttime = datetime.now().strftime('%H:%M:%S')
-                epoch_num = int(blk / 2160)
+                        epoch_num = blk // 2160
                 
-                active_block = shared_state.get("active_blk", 2160)
-                if int(blk) - active_block >= 0:
-                    is_active = str() 
+                        if int(blk) - active_block >= 0:
+                            is_active = str() 
                     
-                else:
-                    active_secs = (active_block - blk) * 10
-                    when_active = (datetime.now() + timedelta(seconds=active_secs)).strftime('%H:%M')
-                    is_active = f"{LIGHT_RED}\n\tActive @ {when_active} - #{active_block} (E: {int(active_block/2160)}){DEFAULT}\n"               
-                
-                chg7d = shared_state["price_change_percentage_7d_in_currency"]
-                chg30d = shared_state["price_change_percentage_30d_in_currency"]
-                chg1y = shared_state["price_change_percentage_1y_in_currency"]
-                
-                ## Currently unused ##
-                chg14d = shared_state["price_change_percentage_14d_in_currency"]
-                chg1hr = shared_state["price_change_percentage_1h_in_currency"]
-                
-                volume = shared_state["volume"]
+                        else:
+                            active_secs = (active_block - blk) * 10
+                            when_active = (datetime.now() + timedelta(seconds=active_secs)).strftime('%H:%M')
+                            is_active = f"\n\t{LIGHT_RED}Active @ {when_active} - #{active_block} (E: {active_block // 2160}){DEFAULT}\n"               
                 
-                mkt_cap = shared_state["market_cap"]
-                mkt_cap_change = shared_state["market_cap_change_percentage_24h"]
+                        ## Also fetched but currently unused: price_change_percentage_14d/1h_in_currency,
+                        ## volume, market_cap, market_cap_change_percentage_24h, ath, ath_change_percentage,
+                        ## ath_date, atl, atl_date
                 
-                ath = shared_state["ath"]
-                ath_change = shared_state["ath_change_percentage"]
-                ath_date = shared_state["ath_date"]
-                
-                atl = shared_state["atl"]
-                atl_date = shared_state["atl_date"]
-                
-                ######################
-                
-                top_bar = f" {LIGHT_WHITE}======={DEFAULT} {currenttime} Block: {LIGHT_BLUE}#{blk} {DEFAULT}(E: {LIGHT_BLUE}{epoch_num}{DEFAULT}) Peers: {peercolor}{shared_state['peer_count']}{DEFAULT} {LIGHT_WHITE}=======\n"
-                title_spaces = int((len(remove_ansi(top_bar)) - len(remove_ansi(byline))) / 2)
-
-                opts = '\n' + (' ' * title_spaces) + BLUE  + shared_state["options"]
+                        ######################
                 
-                allocation_bar = display_wallet_distribution_bar(b['public'],b['shielded'],8)
+                        allocation_bar = display_wallet_distribution_bar(pub, shd, 8)
                 
-                per_epoch = str()
-                rpe = convert_to_float(shared_state.get('rewards_per_epoch',0.0))
-                if  rpe > 0.0: # Check if we have a ~ rewards per epoch since last claim
-                    if int(shared_state.get("last_claim_block", 0)) > 0:
-                        per_epoch = f"@ Epoch/claim: {format_float(rpe)}"
-                    # else:
-                    #     per_epoch = f"Since startup: {format_float(rpe * epoch_num)}"
+                        per_epoch = str()
+                        if  rpe > 0.0: # Check if we have a ~ rewards per epoch since last claim
+                            if last_claim > 0:
+                                per_epoch = f"@ Epoch/claim: {format_float(rpe)}"
+                            # else:
+                            #     per_epoch = f"Since startup: {format_float(rpe * epoch_num)}"
                 
-                reward_percent = 0.0
-                if st_info.get('rewards_amount',0.0) > 0.0 and st_info.get('stake_amount', 0.0) > 0.0:
-                    reward_percent = (st_info.get('rewards_amount',0.0) / st_info.get('stake_amount', 0.0)) * 100
+                        reward_percent = 0.0
+                        if rwd > 0.0 and stk > 0.0:
+                            reward_percent = (rwd / stk) * 100
+
+                        amounts = {
+                            'pub': format_float(pub),
+                            'shd': format_float(shd),
+                            'stk': format_float(stk),
+                            'rwd': format_float(rwd),
+                            'rcl': format_float(rcl),
+                        }
                 
-                realtime_content = (
-                    f"{opts}\n"
-                    f"{top_bar}"
-                    f"    {CYAN}Last Action{DEFAULT}   | {CYAN}{last_act}{DEFAULT}\n"
-                    f"    {LIGHT_GREEN}Next Check    {DEFAULT}| {charclr}{disp_time}{DEFAULT} ({donetime}){DEFAULT}\n"
-                    f"                  |\n"
-                    f"    {LIGHT_WHITE}Price USD{DEFAULT}     | {LIGHT_WHITE}${format_float(price,3)}{DEFAULT} {chg24}\n"
-                    f"                  {DEFAULT}| 7d: {chg7d:.2f}% 30d: {chg30d:.2f}% 1y: {chg1y:.2f}%\n"
-                    f"                  |\n"
-                    f"    {LIGHT_WHITE}Balance{DEFAULT}       | {LIGHT_WHITE}{allocation_bar}\n"
-                    f"      {LIGHT_WHITE}├─ {YELLOW}Public   {DEFAULT}| {YELLOW}{format_float(b['public'])} (${format_float(b['public'] * price, 2)}){DEFAULT}\n"
-                    f"      {LIGHT_WHITE}└─ {BLUE}Shielded {DEFAULT}| {BLUE}{format_float(b['shielded'])} (${format_float(b['shielded'] * price, 2)}){DEFAULT}\n"
-                    f"         {LIGHT_WHITE}   Total {DEFAULT}| {LIGHT_WHITE}{format_float(tot_bal)} DUSK (${format_float((tot_bal) * price, 2)}){DEFAULT}\n"
-                    f"                  |\n"
-                    f"    {LIGHT_WHITE}Staked{DEFAULT}        | {LIGHT_WHITE}{format_float(st_info['stake_amount'])} (${format_float(st_info['stake_amount'] * price, 2)}){DEFAULT}{is_active}\n"
-                    f"    {YELLOW}Rewards{DEFAULT}       | {YELLOW}{format_float(st_info['rewards_amount'])} ({LIGHT_BLUE}{reward_percent:.4f}%{DEFAULT}) (${format_float(st_info['rewards_amount'] * price, 2)}) {LIGHT_WHITE}{per_epoch}{DEFAULT}\n"
-                    f"    {LIGHT_RED}Reclaimable{DEFAULT}   | {LIGHT_RED}{format_float(st_info['reclaimable_slashed_stake'])} (${format_float(st_info['reclaimable_slashed_stake'] * price, 2)}){DEFAULT}\n"
-                    f" {LIGHT_WHITE}{('=' * (len(remove_ansi(top_bar)) - 2))}{DEFAULT}\n"  
-                )
+                        values = {
+                            **amounts,
+                            'last_act': last_act,
+                            'donetime': donetime,
+                            'price': format_float(price, 3),
+                            'chg24': chg24,
+                            'chg7d': chg7d,
+                            'chg30d': chg30d,
+                            'chg1y': chg1y,
+                            'allocation_bar': allocation_bar,
+                            'pub_usd': pub * price,
+                            'shd_usd': shd * price,
+                            'tot': format_float(tot_bal),
+                            'tot_usd': tot_bal * price,
+                            'stk_usd': stk * price,
+                            'is_active': is_active,
+                            'reward_percent': reward_percent,
+                            'rwd_usd': rwd * price,
+                            'per_epoch': per_epoch,
+                            'rcl_usd': rcl * price,
+                        }
+                        tmux_values = {
+                            'blk': blk,
+                            **amounts,
+                            'price': format_float(price, 3),
+                            'chg24': chg24,
+                            'donetime': donetime,
+                            'peers': peer_count,
+                            'error': "- !ERROR DETECTED!" if errored else str(),
+                        }
+                        # Only mark the frame built once everything above succeeded, so a failed
+                        # rebuild is retried next tick instead of leaving stale values on screen
+                        last_frame_key = frame_key
+
+                    # Clock and countdown slots, refreshed every tick
+                    top_bar = _TOP_BAR_TEMPLATE.format(
+                        time=currenttime, blk=blk, epoch=epoch_num,
+                        peercolor=peercolor, peers=peer_count,
+                    )
+                    top_width = len(remove_ansi(top_bar))
+                    title_spaces = int((top_width - _BYLINE_WIDTH) / 2)
+
+                    values['opts'] = '\n' + (' ' * title_spaces) + BLUE  + shared_state["options"]
+                    values['top_bar'] = top_bar
+                    values['footer'] = '=' * (top_width - 2)
+                    values['charclr'] = _REMAIN_COLORS[bisect.bisect_left(_REMAIN_BUCKETS, remain_seconds)]
+                    values['disp_time'] = disp_time
+                    realtime_content = _RT_TEMPLATE.format_map(values)
                 
-                if include_rendered:
-                    shared_state["rendered"] = realtime_content
-                else:
-                    shared_state["rendered"] = None
+                    if include_rendered:
+                        shared_state["rendered"] = realtime_content
+                    else:
+                        shared_state["rendered"] = None
                 
                 
-                # Update the Live display
-                if display_gui:
-                    live.update(Text(realtime_content), refresh=True)
-
-                # Update TMUX status bar
-
-                if enable_tmux:
-                    try:
-                        curblk = f"\r> Blk: #{blk} | "
-                        stk = f"Stk: {format_float(st_info['stake_amount'])} | "
-                        rcl = f"Rcl: {format_float(st_info['reclaimable_slashed_stake'])} | "
-                        rwd = f"Rwd: {format_float(st_info['rewards_amount'])} | "
-                        bal = "Bal: "
-                        p = f"P:{format_float(b['public'])}"
-                        s = f"S:{format_float(b['shielded'])}"
-                        
-                        fields = {
-                            'curblk': status_bar.get('show_current_block', True),
-                            'stk': status_bar.get('show_staked', True),
-                            'p': status_bar.get('show_public', True),
-                            's': status_bar.get('show_shielded', True),
-                            'bal': status_bar.get('show_total', True),
-                            'rwd': status_bar.get('show_rewards', True),
-                            'rcl': status_bar.get('show_reclaimable', True),
-                            'usd': status_bar.get('show_price', True),
-                            'timer': status_bar.get('show_timer', True),
-                            'donetime': status_bar.get('show_trigger_time', True),
-                            'peercnt': status_bar.get('show_peer_count', True)
-                        }
-
-                        for key, show in fields.items():
-                            if not show:
-                                locals()[key] = str()
-
-                        if not fields['p'] and not fields['s']:
-                            bal = splitter = str()
-                        if fields['p'] and fields['s']:
-                            spacer = "  "
-
-                        error_txt = "- !ERROR DETECTED!" if errored else str()
-                        last_txt = str()  # last_act
-                        donetime = f"{DEFAULT}({shared_state['completion_time']}) "
-                        peercnt = f"Peers: {shared_state['peer_count']}"
-                        splitter = " | "
-                        tmux_status = (
-                            f"\r> {curblk}{stk}{rcl}{rwd}{bal}{p}{spacer}{s}{splitter}"
-                            f"{usd}{last_txt}{timer}{donetime}{peercnt} {error_txt}"
-                        )
-
-                        subprocess.check_call(["tmux", "set-option", "-g", "status-left", remove_ansi(tmux_status)])
-                    except subprocess.CalledProcessError:
-                        log_action("tmux Error", "Failed to update tmux status bar. Is tmux running?", "debug")
-                        enable_tmux = False
-
-                await asyncio.sleep(1)
-
-            except Exception as e:
-                log_action(f"Error in real-time display", e, "error")
-                await asyncio.sleep(5)
+                    # Update the Live display
+                    if display_gui:
+                        live.update(ansi_to_text(realtime_content), refresh=True)
+
+                    # Update TMUX status bar
+
+                    if enable_tmux:
+                        try:
+                            tmux_values['timer'] = disp_time
+                            tmux_status = _build_tmux_template(tmux_flags).format_map(tmux_values)
+
+                            tmux_status = remove_ansi(tmux_status)
+                            if tmux_status != last_tmux_status:
+                                if tmux_ctl is not None and not await set_tmux_status(tmux_ctl, tmux_status):
+                                    log_action("tmux Error", "tmux control client closed, falling back to tmux commands", "debug")
+                                    tmux_ctl = None
+                                if tmux_ctl is None:
+                                    await asyncio.to_thread(subprocess.check_call, ["tmux", "set-option", "-g", "status-left", tmux_status])
+                                last_tmux_status = tmux_status
+                        except subprocess.CalledProcessError:
+                            log_action("tmux Error", "Failed to update tmux status bar. Is tmux running?", "debug")
+                            enable_tmux = False
+
+                    await asyncio.sleep(refresh_secs)
+
+                except Exception as e:
+                    log_action(f"Error in real-time display", e, "error")
+                    await asyncio.sleep(5)
+    finally:
+        if tmux_ctl is not None and tmux_ctl.returncode is None:
+            tmux_ctl.stdin.close()
 
 # ─────────────────────────────────────────────────────────────────────────────
 # MAIN
@@ -1149,7 +1527,7 @@ async def main():
 
     # Format the notification services display
     if notification_services:
-        services = "\n\t  " + " ".join(notification_services) if len(notification_services) > 2 else " ".join(notification_services)
+        services = f"\n\t  {YELLOW}" + " ".join(notification_services) if len(notification_services) > 2 else " ".join(notification_services)
     else:
         services = "None"
 
@@ -1179,15 +1557,23 @@ async def main():
         from utilities.web_dashboard import start_dashboard
     await start_dashboard(shared_state, log_entries, host=dash_ip, port=dash_port) 
     
-    await asyncio.gather(
-        frequent_update_loop(),
-        realtime_display(enable_tmux),
-        stake_management_loop(),
-        )
+    try:
+        # If one loop fails, the TaskGroup cancels the others instead of leaving them running
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(frequent_update_loop())
+            tg.create_task(realtime_display(enable_tmux))
+            tg.create_task(stake_management_loop())
+            if notifier.has_sinks():
+                tg.create_task(notification_worker())
+    finally:
+        await close_session()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        with asyncio.Runner() as runner:
+            # Eager tasks let short awaits finish without an extra trip through the event loop
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            runner.run(main())
     except KeyboardInterrupt:
         print("\n\nCTRL-C detected. Exiting gracefully.\n")
         sys.exit(0)
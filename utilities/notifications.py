@@ -2,6 +2,21 @@ import requests
 import logging
 import json
 
+from utilities.timing import remaining_time
+
+# Seconds before a notification request is abandoned, so a dead endpoint can't stall the sender
+REQUEST_TIMEOUT = 10
+
+def webhook_state(shared_state):
+    """
+    Copy of shared_state for the webhook payload. The process-local sleep_deadline
+    (a time.monotonic() value) is swapped for the seconds remaining until it.
+    """
+    state = dict(shared_state)
+    if state.pop("sleep_deadline", None) is not None:
+        state["remain_time"] = remaining_time(shared_state)
+    return state
+
 class NotificationService:
     def __init__(self, config, sharedinfo=None):
         """
@@ -25,6 +40,20 @@ class NotificationService:
         self.pushover_app_token = config.get('pushover_app_token')
         self.webhook_url = config.get('webhook_url')
         self.slack_webhook = config.get('slack_webhook')
+        self._has_sinks = bool(
+            self.discord_webhook
+            or self.pushbullet_token
+            or (self.telegram_bot_token and self.telegram_chat_id)
+            or (self.pushover_user_key and self.pushover_app_token)
+            or self.webhook_url
+            or self.slack_webhook
+        )
+
+    def has_sinks(self):
+        """
+        Return True if at least one notification service is configured.
+        """
+        return self._has_sinks
 
     def notify(self, message, shared_state=None):
         """
@@ -61,10 +90,10 @@ class NotificationService:
         """
         try:
             headers = {'Content-Type': 'application/json'}
-            payload = json.dumps(shared_state, indent=2)
+            payload = json.dumps(webhook_state(shared_state), indent=2)
             
             logging.debug(f"Sending shared state to webhook URL: {self.webhook_url}")
-            response = requests.post(self.webhook_url, headers=headers, data=payload)
+            response = requests.post(self.webhook_url, headers=headers, data=payload, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 logging.debug("Webhook sent successfully.")
@@ -91,10 +120,10 @@ class NotificationService:
         webhook_url = self.webhook_url
         try:
             headers = {'Content-Type': 'application/json'}
-            payload = json.dumps(shared_state, indent=2)
+            payload = json.dumps(webhook_state(shared_state), indent=2)
             
             logging.debug(f"Sending shared state to webhook URL: {webhook_url}")
-            response = requests.post(webhook_url, headers=headers, data=payload)
+            response = requests.post(webhook_url, headers=headers, data=payload, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 logging.debug("Webhook sent successfully.")
@@ -113,7 +142,7 @@ class NotificationService:
         """
         try:
             payload = {"content": message}
-            response = requests.post(self.discord_webhook, json=payload)
+            response = requests.post(self.discord_webhook, json=payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             logging.debug("Discord notification sent successfully.")
         except Exception as e:
@@ -130,7 +159,7 @@ class NotificationService:
             }
             message = message.replace('Dusk (', 'Dusk\n\t(')
             payload = {"type": "note", "title": "Dusk Alert", "body": message}
-            response = requests.post("https://api.pushbullet.com/v2/pushes", json=payload, headers=headers)
+            response = requests.post("https://api.pushbullet.com/v2/pushes", json=payload, headers=headers, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             logging.debug("Pushbullet notification sent successfully.")
         except Exception as e:
@@ -143,7 +172,7 @@ class NotificationService:
         try:
             url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
             payload = {"chat_id": self.telegram_chat_id, "text": message}
-            response = requests.post(url, json=payload)
+            response = requests.post(url, json=payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             logging.debug("Telegram notification sent successfully.")
         except Exception as e:
@@ -159,7 +188,7 @@ class NotificationService:
                 "user": self.pushover_user_key,
                 "message": message
             }
-            response = requests.post("https://api.pushover.net/1/messages.json", data=payload)
+            response = requests.post("https://api.pushover.net/1/messages.json", data=payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             logging.debug("Pushover notification sent successfully.")
         except Exception as e:
@@ -171,7 +200,7 @@ class NotificationService:
         """
         try:
             payload = {"text": message}
-            response = requests.post(self.slack_webhook, json=payload)
+            response = requests.post(self.slack_webhook, json=payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             logging.debug("Slack notification sent successfully.")
         except Exception as e:
@@ -0,0 +1,7 @@
+import time
+
+def remaining_time(shared_state):
+    """
+    Return the whole seconds left until shared_state["sleep_deadline"] (a time.monotonic() value).
+    """
+    return max(0, int(shared_state.get("sleep_deadline", 0.0) - time.monotonic()))
@@ -1,12 +1,19 @@
 import os
+import json
 import datetime
 import logging
 import threading
 import asyncio
 
-from flask import Flask, jsonify, render_template
+from flask import Flask, render_template
 import waitress
 
+from utilities.timing import remaining_time
+
+# Stand-in for remain_time while encoding, so the per-second value can be spliced in afterwards
+_REMAIN_PLACEHOLDER = "\x00remain_time\x00"
+_REMAIN_PLACEHOLDER_JSON = json.dumps(_REMAIN_PLACEHOLDER).encode()
+
 def create_app(shared_state, log_entries):
     """
     Creates the Flask app:
@@ -26,6 +33,10 @@ def create_app(shared_state, log_entries):
     with open(os.path.join(static_dir, 'light.css'), 'r', encoding='utf-8') as f:
         light_css = f.read()
 
+    # Last encoded /api/data payload as (key, prefix, suffix). remain_time ticks every
+    # second, so it's left out of the encoded body and spliced in per request.
+    payload_cache = {"entry": (None, b"", b"")}
+
     @app.route("/")
     def index():
         # Pass current year and the loaded CSS strings to the template
@@ -36,13 +47,12 @@ def create_app(shared_state, log_entries):
             light_css=light_css
         )
 
-    @app.route("/api/data")
-    def data_api():
-        # Build data from shared_state
+    def encode_payload():
+        # Build data from shared_state, with a placeholder where remain_time goes
         data = {
             "block_height": shared_state["block_height"],
             "peer_count": shared_state["peer_count"],
-            "remain_time": shared_state["remain_time"],
+            "remain_time": _REMAIN_PLACEHOLDER,
             "completion_time": shared_state["completion_time"],
             "balances_public":   shared_state["balances"]["public"],
             "balances_shielded": shared_state["balances"]["shielded"],
@@ -62,7 +72,34 @@ def create_app(shared_state, log_entries):
         # Reverse the logs so newest appear first
         reversed_logs = list(reversed(log_entries))
 
-        return jsonify({"data": data, "log_entries": reversed_logs})
+        body = json.dumps(
+            {"data": data, "log_entries": reversed_logs},
+            sort_keys=True, separators=(",", ":"),
+        ).encode()
+        prefix, suffix = body.split(_REMAIN_PLACEHOLDER_JSON, 1)
+        return prefix, suffix
+
+    @app.route("/api/data")
+    def data_api():
+        # Cheap change check over the raw values; only re-encode when one of them moved
+        balances = shared_state["balances"]
+        stake_info = shared_state["stake_info"]
+        key = (
+            shared_state["block_height"], shared_state["peer_count"], shared_state["completion_time"],
+            balances["public"], balances["shielded"], shared_state["price"], shared_state["usd_24h_change"],
+            stake_info["stake_amount"], stake_info["rewards_amount"], stake_info["reclaimable_slashed_stake"],
+            shared_state["last_action_taken"], shared_state["rendered"],
+            tuple(log_entries),
+        )
+        # Entries are replaced as whole tuples, so concurrent waitress threads never see a mix
+        cached_key, prefix, suffix = payload_cache["entry"]
+        if key != cached_key:
+            prefix, suffix = encode_payload()
+            payload_cache["entry"] = (key, prefix, suffix)
+
+        remain_time = remaining_time(shared_state)
+        body = prefix + str(remain_time).encode() + suffix
+        return app.response_class(body, mimetype="application/json")
 
     return app
 